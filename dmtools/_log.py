@@ -1,3 +1,6 @@
+import math
+
+
 def _log_msg(name: str, size: int) -> str:  # pragma: no cover
     """Return log message for creation of file.
 
@@ -8,10 +11,7 @@ def _log_msg(name: str, size: int) -> str:  # pragma: no cover
     Returns:
         str: Log message with information about the created file.
     """
-    i = 0
     units = ['B', 'KB', 'MB', 'GB', 'TB']
-    while size >= 1000:
-        size = round(size / 1000)
-        i += 1
-    size_str = '%d%s' % (size, units[i])
+    i = 0 if size < 1000 else min(int(math.log10(size)) // 3, len(units)-1)
+    size_str = '%d%s' % (size // 1000**i, units[i])
     return "%s | %s" % (name, size_str)
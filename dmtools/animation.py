@@ -63,7 +63,7 @@ def to_mp4(frames: List[np.ndarray], path: str, fps: int, s: int = 1,
         fps (int): Frames per second.
         s (int, optional): Multiplier for scaling. Defaults to 1.
     """
-    frames = [_discretize(f, 255).astype(np.uint8) for f in frames]
+    frames = [_discretize(f, 255, np.uint8) for f in frames]
     frames = [_pad_to_16(f) for f in frames]
     imageio.mimwrite(uri="tmp.mp4" if audio is not None else path,
                      ims=frames,
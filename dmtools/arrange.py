@@ -17,23 +17,21 @@ def image_grid(images: List[np.ndarray], w: int, h: int, b: int,
         np.ndarray: grid layout of the images.
     """
     n,m,*k = images[0].shape
+    H = h*n + (h+1)*b
+    W = w*m + (w+1)*b
     if len(k) == 0:
         color = 1 if color is None else color
-        h_border = np.full((b, w*m + (w+1)*b), color)
-        v_border = np.full((n, b), color)
+        shape = (H, W)
     else:
-        k = k[0]
-        color = np.ones(k) if color is None else color
-        h_border = np.full((b, w*m + (w+1)*b, k), color)
-        v_border = np.full((n, b, k), color)
-    grid_layout = h_border
-    for i in range(h):
-        row = v_border
-        for j in range(w):
-            row = np.hstack((row, images[(i*w) + j]))
-            row = np.hstack((row, v_border))
-        grid_layout = np.vstack((grid_layout, row))
-        grid_layout = np.vstack((grid_layout, h_border))
+        color = np.ones(k[0]) if color is None else color
+        shape = (H, W, k[0])
+    dtype = np.result_type(images[0], np.asarray(color))
+    grid_layout = np.full(shape, color, dtype=dtype)
+    for p in range(w*h):
+        i, j = divmod(p, w)
+        row_off = b + i*(n+b)
+        col_off = b + j*(m+b)
+        grid_layout[row_off:row_off+n, col_off:col_off+m] = images[p]
     return grid_layout
 
 
@@ -6,7 +6,6 @@ import pkgutil
 from datetime import datetime
 from imageio import imread, imwrite
 from PIL import PngImagePlugin
-from typing import List
 from ._log import _log_msg
 import logging
 
@@ -127,18 +126,24 @@ def _continuous(image: np.ndarray, k: int) -> np.ndarray:
     return image / k
 
 
-def _discretize(image: np.ndarray, k: int) -> np.ndarray:
+def _discretize(image: np.ndarray, k: int,
+                dtype: type = int) -> np.ndarray:
     """Discretize a continuous image.
 
     Args:
         image (np.ndarray): Continuous image with values in [0,1].
         k (int): Maximum color/gray value.
+        dtype (type): Data type of the discrete image. Defaults to int.
 
     Returns:
         np.ndarray: Discrete image with values in [0,k].
     """
     # TODO: Is this the right way to discretize?
-    return np.ceil(k*image - 0.5).astype(int)
+    # scale, shift, and round in one buffer of the image's float precision
+    M = np.multiply(image, k, dtype=np.result_type(image, 1.0))
+    M -= 0.5
+    np.ceil(M, out=M)
+    return M.astype(dtype)
 
 
 def get_next_version(path: str) -> str:
@@ -187,26 +192,28 @@ def write_png(image: np.ndarray, path: str, versioning=False, metadata=None):
         path = get_next_version(path)
     if path.split('.')[-1] != 'png':
         path += '.png'
-    im = _discretize(image, 255).astype(np.uint8)
+    im = _discretize(image, 255, np.uint8)
     metadata = Metadata() if metadata is None else metadata
     imwrite(im=im, uri=path, format='png', pnginfo=metadata._to_pnginfo())
 
 
-def _parse_ascii_netpbm(f: List[str]) -> np.ndarray:
+def _parse_ascii_netpbm(text: str) -> np.ndarray:
     # adapted from code by Dan Torop
-    vals = [v for line in f for v in line.split('#')[0].split()]
-    P = int(vals[0][1])
+    text = re.sub(r'#[^\n]*', '', text)
+    P = int(text.split(None, 1)[0][1])
     if P == 1:
-        w, h, *vals = [v for v in vals[1:]]
+        _, w, h, vals = text.split(None, 3)
         w = int(w)
         h = int(h)
-        vals = [int(i) for i in list(''.join(vals))]
+        # pbm pixels need not be separated by whitespace
+        vals = ''.join(vals.split()).encode()
+        M = np.frombuffer(vals, dtype=np.uint8) - ord('0')
+        M = -M.astype(int) + 1
         k = 1
     else:
-        w, h, k, *vals = [int(v) for v in vals[1:]]
-    M = np.array(vals)
-    if P == 1:
-        M = -M + 1
+        _, w, h, k, vals = text.split(None, 4)
+        w, h, k = int(w), int(h), int(k)
+        M = np.fromstring(vals, dtype=int, sep=' ')
     if P == 3:
         M = M.reshape(h, w, 3)
     else:
@@ -229,7 +236,7 @@ def _parse_binary_netpbm(path: str) -> np.ndarray:
         tokens = [int(t) for t in tokens]
         w, h, *_ = tokens
         k = 1 if P == 4 else tokens[2]
-        M = np.fromfile(f, 'uint8')
+        M = np.fromfile(f, '>u2' if k > 255 else 'uint8')
         if P == 4:
             # get bits from bytes
             M = np.unpackbits(M)
@@ -262,9 +269,8 @@ def read_netpbm(path: str) -> np.ndarray:
 
     Each of the formats has two "magic numbers" associated with it. The lower
     number corresponds to the ASCII (plain) format while the higher number
-    corresponds to the binary (raw) format. This class can handle reading both
-    the plain and raw formats though it can only export Netpbm images in the
-    plain formats (:code:`P1`, :code:`P2`, and :code:`P3`).
+    corresponds to the binary (raw) format. This module can handle reading and
+    writing both the plain and raw formats.
 
     The plain formats for all three of pbm, pgm, and ppm are quite similar.
     Here is an example pgm format.
@@ -309,17 +315,18 @@ def read_netpbm(path: str) -> np.ndarray:
     if int(magic_number[1]) <= 3:
         # P1, P2, P3 are the ASCII (plain) formats
         with open(path) as f:
-            return _parse_ascii_netpbm(f)
+            return _parse_ascii_netpbm(f.read())
     else:
         # P4, P5, P6 are the binary (raw) formats
         return _parse_binary_netpbm(path)
 
 
 def write_netpbm(image: np.ndarray, k: int, path: str,
-                 versioning=False, metadata=None):
+                 versioning=False, metadata=None, plain=True):
     """Write object to a Netpbm file (pbm, pgm, ppm).
 
-    Uses the ASCII (plain) magic numbers.
+    Uses the ASCII (plain) magic numbers unless plain is False, in which case
+    the binary (raw) magic numbers are used.
 
     Args:
         image (np.ndarray): NumPy array representing image.
@@ -327,6 +334,7 @@ def write_netpbm(image: np.ndarray, k: int, path: str,
         path (str): String file path.
         versioning (bool): Version files (rather than overwrite).
         metadata (Metadata): Metadata for image. Defaults to Metadata().
+        plain (bool): True iff write in the plain format. Defaults to True.
     """
     if versioning:
         path = get_next_version(path)
@@ -341,19 +349,36 @@ def write_netpbm(image: np.ndarray, k: int, path: str,
         path += '.%s' % P_to_ext[P]
     if P == 1:
         image = -image + 1
-    with open(path, "w") as f:
-        f.write('P%d\n' % P)
-        f.write("%s %s\n" % (w, h))
-        if P != 1:
-            f.write("%s\n" % (k))
-        if P == 3:
-            image = image.reshape(h, w * 3)
-        f.write(metadata._to_comment_string())
-        image = _discretize(image, k)
-        lines = image.astype(str).tolist()
-        f.write('\n'.join([' '.join(line) for line in lines]))
-        f.write('\n')
-        logging.info(_log_msg(path, os.stat(path).st_size))
+    if P == 3:
+        image = image.reshape(h, w * 3)
+    image = _discretize(image, k)
+    comment = metadata._to_comment_string().encode()
+    dims = b"%d %d\n" % (w, h) + (b"" if P == 1 else b"%d\n" % k)
+    with open(path, "wb", buffering=1 << 20) as f:
+        if plain:
+            f.write(b'P%d\n' % P + dims + comment)
+            np.savetxt(f, image, fmt='%d', delimiter=' ')
+        else:
+            # comments must precede the last header token in raw formats
+            f.write(b'P%d\n' % (P + 3) + comment + dims)
+            if P == 1:
+                image = np.packbits(image.astype(np.uint8), axis=1)
+            else:
+                image = image.astype('>u2' if k > 255 else np.uint8)
+            image.tofile(f)
+    logging.info(_log_msg(path, os.stat(path).st_size))
+
+
+# small images of each character used when writing ASCII art to PNG
+_ASCII_PGM = pkgutil.get_data(__name__, "resources/ascii.pgm").decode()
+_ASCII_M = _parse_ascii_netpbm(_ASCII_PGM)
+_ASCII_H, _ASCII_W = _ASCII_M.shape[0], _ASCII_M.shape[1] // 13
+_CHAR_GLYPHS = np.zeros((13, _ASCII_H, _ASCII_W + 12), dtype=_ASCII_M.dtype)
+_CHAR_GLYPHS[:,:,6:6+_ASCII_W] = \
+    _ASCII_M.reshape(_ASCII_H, 13, _ASCII_W).transpose(1,0,2)
+# index of each character's glyph in _CHAR_GLYPHS (by byte value)
+_CHAR_ORD_LUT = np.full(256, -1, dtype=np.int8)
+_CHAR_ORD_LUT[np.frombuffer(b" .,-~:;=!*#$@", dtype=np.uint8)] = np.arange(13)
 
 
 def write_ascii(image: np.ndarray, path: str, txt:str = False):
@@ -364,31 +389,32 @@ def write_ascii(image: np.ndarray, path: str, txt:str = False):
         path (str): String file path.
         txt (str): True iff write to a txt file. Defaults to False.
     """
-    char_map = "   -~:;=!*#$@"
-    image = _discretize(image, len(char_map)-1)
+    char_map = np.frombuffer(b"   -~:;=!*#$@", dtype='S1')
+    image = _discretize(image, len(char_map)-1, np.uint8)
+    codes = np.take(char_map, image).view(np.uint8)
     if not txt:
-        # generate char map to small images of each character
-        file = pkgutil.get_data(__name__, "resources/ascii.pgm")
-        f = file.decode().split('\n')
-        M = _parse_ascii_netpbm(f)
-        char_ims = [np.pad(M,((0,0),(6,6))) for M in np.split(M, 13, axis=1)]
-        char_image_map = dict(zip(list(" .,-~:;=!*#$@"), char_ims))
-
-        # create image of ascii art and write to PNG
-        A = np.copy(image)
-        n,m = A.shape
-        M = []
-        for i in range(n):
-            M.append([char_image_map[char_map[A[i,j]]] for j in range(m)])
-        M = np.block(M)
+        glyph_index = _CHAR_ORD_LUT[codes]
+        n,m = glyph_index.shape
+        _, ch, cw = _CHAR_GLYPHS.shape
+        rows, inverse = np.unique(glyph_index, axis=0, return_inverse=True)
+        if 2*len(rows) < n:
+            # tile each distinct row once; expanding the strips costs an
+            # extra copy, so this only pays off when most rows repeat
+            tiles = _CHAR_GLYPHS[rows]
+            strips = tiles.transpose(0,2,1,3).reshape(len(rows), ch, m*cw)
+            M = strips[inverse.ravel()].reshape(n*ch, m*cw)
+        else:
+            tiles = _CHAR_GLYPHS[glyph_index]
+            M = tiles.transpose(0,2,1,3).reshape(n*ch, m*cw)
         write_png(M, path)
         logging.info(_log_msg(path, os.stat(path).st_size))
     else:
         if path.split('.')[-1] != 'txt':
             path += '.txt'
-        with open(path, "w") as f:
-            lines = [[char_map[j] for j in row] for row in image]
-            f.write('\n'.join([' '.join(line) for line in lines]))
+        with open(path, "wb") as f:
+            np.savetxt(f, codes, fmt='%c', delimiter=' ', newline='\n')
+            # drop the newline np.savetxt writes after the last row
+            f.truncate(f.tell() - 1)
         logging.info(_log_msg(path, os.stat(path).st_size))
 
 
@@ -48,6 +48,8 @@ OPAQUE_PIXEL_BLACK_BORDER = \
     ([WHITE_PIXEL], 1, 1, 2, np.array([0]), WHITE_PIXEL_BLACK_BORDER),
     ([WHITE_PIXEL]*4, 2, 2, 1, np.array([0]), FOUR_WHITE_PIXEL_GRID),
     ([COLOR_PIXEL], 1, 1, 1, np.array([0,0,0]), COLOR_PIXEL_BLACK_BORDER),
+    ([COLOR_PIXEL], 1, 1, 1, [0,0,0], COLOR_PIXEL_BLACK_BORDER),
+    ([COLOR_PIXEL], 1, 1, 1, (0,0,0), COLOR_PIXEL_BLACK_BORDER),
     ([OPAQUE_PIXEL], 1, 1, 1, None, OPAQUE_PIXEL_BLACK_BORDER)])
 def test_image_grid(images, w, h, b, color, result):
     assert np.array_equal(result, image_grid(images, w, h, b, color))
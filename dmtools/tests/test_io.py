@@ -65,6 +65,26 @@ def test_netpbm_io(name, k, new_ext):
     assert np.array_equal(src, image)
 
 
+@pytest.mark.parametrize("name,k,new_ext",[
+    ('color_matrix_ascii.pbm', 1, 'pbm'),
+    ('color_matrix_ascii.pgm', 255, 'pgm'),
+    ('color_matrix_ascii.ppm', 255, 'ppm'),
+    ('color_matrix_ascii.ppm', 65535, 'ppm')])
+def test_netpbm_raw_io(name, k, new_ext):
+    # read image
+    src = read(os.path.join(RESOURCES_PATH, name))
+
+    file_name = 'test.%s' % new_ext
+    write_netpbm(src, k, file_name, plain=False)
+    with open(file_name, 'rb') as f:
+        magic_number = f.read(2).decode()
+    image = read(file_name)
+    os.remove(file_name)
+
+    assert int(magic_number[1]) > 3
+    assert np.array_equal(src, image)
+
+
 @pytest.mark.parametrize("src,txt_expected_path,png_expected_path",[
     ('12_gradient.pgm', '12_gradient.txt', '12_gradient.png')])
 def test_ascii_io(src, txt_expected_path, png_expected_path):